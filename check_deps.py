@@ -4,6 +4,17 @@ Script to check dependency installation.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def try_import(module):
+    """Imports module, returns True on success."""
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
 
 def check_dependencies():
     """Checks installation of all required dependencies."""
@@ -15,11 +26,14 @@ def check_dependencies():
     all_installed = True
     print("Checking dependencies...\n")
     
-    for module, name in dependencies.items():
-        try:
-            __import__(module)
+    # Import in parallel, print results in a fixed order
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        results = list(executor.map(try_import, dependencies))
+    
+    for name, installed in zip(dependencies.values(), results):
+        if installed:
             print(f"✓ {name} is installed")
-        except ImportError:
+        else:
             print(f"✗ {name} is not installed")
             all_installed = False
     
@@ -30,10 +44,11 @@ def check_dependencies():
         
         # Check MPS support for Apple Silicon
         try:
-            import torch
-            if torch.backends.mps.is_available():
+            from device import detect_device
+            device = detect_device()
+            if device == "mps":
                 print("✓ Apple Silicon GPU (MPS) support is available")
-            elif torch.cuda.is_available():
+            elif device == "cuda":
                 print("✓ NVIDIA GPU (CUDA) support is available")
             else:
                 print("✓ CPU will be used")
@@ -0,0 +1,15 @@
+"""
+Detection of the torch device used for processing.
+Has no import-time side effects, so it can be shared by all scripts.
+"""
+
+
+def detect_device() -> str:
+    """Returns best available torch device: "mps", "cuda" or "cpu"."""
+    import torch
+    
+    if torch.backends.mps.is_available():
+        return "mps"
+    if torch.cuda.is_available():
+        return "cuda"
+    return "cpu"
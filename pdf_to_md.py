@@ -11,21 +11,78 @@ Supports:
 """
 
 import argparse
+import functools
+import importlib.metadata
+import importlib.util
+import inspect
 import sys
 import signal
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from device import detect_device
+
 # Enable display of HuggingFace model loading progress
-os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "0")  # Stable download
 os.environ.setdefault("TQDM_DISABLE", "0")  # Enable progress bars
 
-import torch
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
+
+def hub_supports_hf_transfer() -> bool:
+    """
+    Checks if installed huggingface_hub can use hf_transfer.
+    Support was removed in huggingface_hub 1.0 (it uses hf_xet instead).
+    """
+    try:
+        version = importlib.metadata.version("huggingface_hub")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return int(version.split(".")[0]) < 1
+
+
+# Fast multi-connection downloads when the hf_transfer extension is available
+if hub_supports_hf_transfer() and importlib.util.find_spec("hf_transfer"):
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# Persistent model cache shared between runs
+os.environ.setdefault("HF_HOME", str(Path.home() / ".cache" / "docling-ru"))
+MODELS_DIR = Path(os.environ["HF_HOME"]) / "docling-models"
+
+# Model components used by the pipeline; changing the lists triggers a new download
+MODEL_COMPONENTS = ["layout", "tableformer", "easyocr"]
+# EasyOCR recognizers for the OCR languages ("ru" needs cyrillic_g2)
+EASYOCR_LANGS = ["ru", "en"]
+EASYOCR_RECOGNITION_MODELS = ["cyrillic_g2", "english_g2"]
+
+# Lives inside MODELS_DIR, so deleting the models also removes the marker
+MODELS_MARKER = MODELS_DIR / ".docling_ready"
+
+
+def get_models_key() -> str:
+    """Returns description of required models, stored in the marker file."""
+    return ",".join(MODEL_COMPONENTS) + ";easyocr=" + ",".join(EASYOCR_RECOGNITION_MODELS)
+
+
+def models_ready() -> bool:
+    """Checks that all required models were downloaded to MODELS_DIR."""
+    try:
+        return MODELS_MARKER.read_text(encoding='utf-8') == get_models_key()
+    except OSError:
+        return False
+
+
+# Models are already downloaded: skip HuggingFace revalidation requests.
+# Must be set before huggingface_hub is imported (read at import time).
+if models_ready():
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+# One-page document used to load models before the first real conversion
+WARMUP_PDF = Path(__file__).with_name("warmup.pdf")
+
+# Note: torch and docling are imported lazily inside functions,
+# so --help and input validation errors return without the heavy import cost
 
 
 # Configure logging to display model loading progress
@@ -58,49 +115,82 @@ def signal_handler(sig, frame):
 
 def download_models():
     """
-    Pre-downloads all models required for Docling.
+    Pre-downloads the models required by the configured Docling pipeline.
     Called before conversion to avoid hanging on first run.
     """
-    from huggingface_hub import snapshot_download
-    
-    # All models used by Docling (including those loaded during convert)
-    models_to_download = [
-        # Main Docling models
-        "ds4sd/docling-models",
-        "docling-project/docling-models",
-        # Layout models (used for structure recognition)
-        "docling-project/docling-layout-heron",
-        "ds4sd/docling-ibm-granite-dense-layout-heron",
-        # TableFormer models (for table recognition)
-        "ds4sd/docling-tableformer",
-        "docling-project/tableformer",
-        # RT-DETR models (element detection)
-        "PekingU/rtdetr_r50vd",
+    if models_ready():
+        return
+    
+    from docling.utils.model_downloader import download_models as docling_download
+    
+    # Only the artifacts used by the pipeline, one download job per component.
+    # Available with_* flags differ between Docling versions, so take them from the signature.
+    flag_names = [
+        name for name in inspect.signature(docling_download).parameters
+        if name.startswith("with_")
     ]
     
+    def download_component(component):
+        if component == "easyocr":
+            # Docling's downloader fetches only Latin recognizers, Russian needs cyrillic_g2.
+            # Downloads are disabled when artifacts_path is set, so fetch it explicitly.
+            try:
+                from docling.models.stages.ocr.easyocr_model import EasyOcrModel
+            except ImportError:  # Older Docling releases
+                from docling.models.easyocr_model import EasyOcrModel
+            EasyOcrModel.download_models(
+                recognition_models=EASYOCR_RECOGNITION_MODELS,
+                local_dir=MODELS_DIR / "EasyOcr",
+                progress=False,
+            )
+            return
+        flags = {name: name == f"with_{component}" for name in flag_names}
+        docling_download(output_dir=MODELS_DIR, progress=False, **flags)
+    
+    def download_all(names):
+        """Downloads components concurrently, returns list of (component, error)."""
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {executor.submit(download_component, c): c for c in names}
+            for future in as_completed(futures):
+                component = futures[future]
+                try:
+                    future.result()
+                    print(f"   📦 {component}... ✓")
+                except Exception as e:
+                    print(f"   📦 {component}... ⚠ error: {e}")
+                    errors.append((component, e))
+        return errors
+    
+    # Broken hf_transfer installation: use the stable downloader from the start.
+    # The flag is process-wide, so it is only changed while no downloads run.
+    # The flag does not exist in huggingface_hub 1.0+.
+    from huggingface_hub import constants
+    if getattr(constants, "HF_HUB_ENABLE_HF_TRANSFER", False):
+        try:
+            import hf_transfer  # noqa: F401
+        except ImportError:
+            constants.HF_HUB_ENABLE_HF_TRANSFER = False
+    
     print("⏳ Checking and downloading models...")
     print("   (on first run, download may take a few minutes)\n")
     
-    downloaded = 0
-    for model_id in models_to_download:
-        try:
-            print(f"   📦 {model_id}...", end=" ", flush=True)
-            snapshot_download(
-                repo_id=model_id,
-                local_files_only=False,
-                resume_download=True,
-            )
-            print("✓")
-            downloaded += 1
-        except Exception as e:
-            # Model may not exist or be unavailable
-            error_str = str(e).lower()
-            if "404" in error_str or "not found" in error_str or "doesn't have" in error_str:
-                print("skipped")
-            else:
-                print(f"⚠ error")
+    # Components are independent, so download them concurrently
+    errors = download_all(MODEL_COMPONENTS)
     
-    print(f"\n✓ Models downloaded: {downloaded}\n")
+    # Retry downloads that failed inside hf_transfer with the stable downloader
+    retry = [component for component, e in errors if "hf_transfer" in str(e)]
+    if retry and getattr(constants, "HF_HUB_ENABLE_HF_TRANSFER", False):
+        print("\n   ⚠ hf_transfer failed, retrying with the stable downloader")
+        constants.HF_HUB_ENABLE_HF_TRANSFER = False
+        errors = [(c, e) for c, e in errors if c not in retry] + download_all(retry)
+    
+    if errors:
+        raise RuntimeError(f"Failed to download {len(errors)} model(s), try running again")
+    
+    MODELS_MARKER.parent.mkdir(parents=True, exist_ok=True)
+    MODELS_MARKER.write_text(get_models_key(), encoding='utf-8')
+    print("\n✓ Models downloaded\n")
 
 
 def setup_device():
@@ -108,20 +198,284 @@ def setup_device():
     Device setup for processing.
     Automatically uses GPU on Apple M-series chips if available.
     """
-    if torch.backends.mps.is_available():
-        device = "mps"
+    device = detect_device()
+    
+    if device == "mps":
         print(f"✓ Using Apple Silicon GPU (Metal Performance Shaders)")
-    elif torch.cuda.is_available():
-        device = "cuda"
+    elif device == "cuda":
         print(f"✓ Using NVIDIA GPU (CUDA)")
     else:
-        device = "cpu"
         print(f"✓ Using CPU")
     
     return device
 
 
-def convert_pdf_to_markdown(pdf_path: str, output_path: str = None) -> str:
+def configure_threads() -> int:
+    """
+    Lets PyTorch use all CPU cores for intra-op parallelism.
+    Many containers otherwise default to a single thread.
+    """
+    import torch
+    
+    num_threads = os.cpu_count() or 8
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        pass  # Can only be set once, before any parallel work has started
+    
+    return num_threads
+
+
+def configure_precision(device: str):
+    """
+    Enables TF32 matmuls on NVIDIA GPUs.
+    Unlike torch.autocast this setting is process-wide, so it also applies
+    to the worker threads of the threaded pipeline.
+    On MPS and CPU models keep running in FP32: PyTorch has no process-wide
+    reduced-precision switch for them.
+    """
+    import torch
+    
+    if device == "cuda":
+        torch.set_float32_matmul_precision("high")
+
+
+def get_batch_sizes(device: str) -> dict:
+    """
+    Returns batch sizes for the threaded pipeline stages.
+    GPUs benefit from larger batches, on CPU small batches keep latency low.
+    """
+    if device in ("mps", "cuda"):
+        return {"layout": 32, "table": 4, "ocr": 32}
+    return {"layout": 4, "table": 4, "ocr": 4}
+
+
+def validate_pdf(pdf_path: str) -> Path:
+    """Checks that input file exists and has .pdf extension."""
+    pdf_file = Path(pdf_path)
+    if not pdf_file.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    
+    if not pdf_file.suffix.lower() == '.pdf':
+        raise ValueError(f"File must have .pdf extension: {pdf_path}")
+    
+    return pdf_file
+
+
+@functools.lru_cache(maxsize=1)
+def _build_converter(device: str, fast_tables: bool = False):
+    """
+    Creates DocumentConverter for the given device.
+    Cached, so models are loaded once and reused for all following documents.
+    """
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import (
+        EasyOcrOptions,
+        TableFormerMode,
+        ThreadedPdfPipelineOptions,
+    )
+    from docling.datamodel.settings import settings
+    from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
+    
+    # Configure PDF processing options
+    # Threaded pipeline overlaps page rendering, layout, table and OCR stages
+    batch_sizes = get_batch_sizes(device)
+    # Several documents are processed concurrently by convert_all()
+    settings.perf.doc_batch_size = 4
+    settings.perf.doc_batch_concurrency = 4
+    
+    configure_precision(device)
+    
+    pipeline_options = ThreadedPdfPipelineOptions()
+    pipeline_options.artifacts_path = MODELS_DIR  # Models from download_models()
+    pipeline_options.accelerator_options = AcceleratorOptions(
+        num_threads=configure_threads(),
+        device=AcceleratorDevice.AUTO,
+    )
+    pipeline_options.do_ocr = True  # Enable OCR for Russian text
+    # Only Russian and English; pages with a text layer skip OCR
+    pipeline_options.ocr_options = EasyOcrOptions(lang=EASYOCR_LANGS, force_full_page_ocr=False)
+    pipeline_options.do_table_structure = True  # Table structure recognition
+    if fast_tables:
+        pipeline_options.table_structure_options.mode = TableFormerMode.FAST
+    pipeline_options.layout_batch_size = batch_sizes["layout"]
+    pipeline_options.table_batch_size = batch_sizes["table"]
+    pipeline_options.ocr_batch_size = batch_sizes["ocr"]
+    
+    # Create converter with settings
+    # AUTO accelerator picks the best available device (MPS/CUDA/CPU)
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=ThreadedStandardPdfPipeline,
+                pipeline_options=pipeline_options,
+            )
+        }
+    )
+
+
+# One-time initialization state, shared by all threads
+_init_lock = threading.Lock()
+_device = None
+
+
+def _init_once(fast_tables: bool = False):
+    """
+    Prepares environment once per process and returns converter ready
+    for processing: device setup, model download and converter creation.
+    Safe to call from several threads, e.g. request handlers of a web server.
+    """
+    global _device
+    
+    with _init_lock:
+        if _device is None:
+            # Device setup, also used to tune pipeline batch sizes
+            device = setup_device()
+            
+            # Pre-download all models
+            download_models()
+            
+            _device = device
+        
+        return _build_converter(_device, fast_tables)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_writer() -> ThreadPoolExecutor:
+    """Returns background writer; a single thread keeps files written in order."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="md-writer")
+
+
+def _write_markdown(output_path: Path, markdown_content: str, append: bool = False):
+    """Writes Markdown to file through a large buffer."""
+    with open(output_path, 'a' if append else 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(markdown_content)
+
+
+def write_markdown_async(output_path: Path, markdown_content: str, append: bool = False):
+    """
+    Saves Markdown in a background thread, so disk I/O overlaps
+    with processing of the next document.
+    
+    Returns:
+        Future, completed when the file is written
+    """
+    return _get_writer().submit(_write_markdown, output_path, markdown_content, append)
+
+
+def warmup_converter(converter):
+    """
+    Converts a one-page document so that pipeline and models are initialized
+    before the first real document arrives.
+    The threaded pipeline has no page batch size to pin (it ignores
+    settings.perf.page_batch_size), so warmup only covers model loading.
+    """
+    if not WARMUP_PDF.exists():
+        return
+    
+    print("⏳ Loading models...")
+    warmup_start = time.time()
+    converter.convert(str(WARMUP_PDF), raises_on_error=False)
+    print(f"✓ Models loaded in {time.time() - warmup_start:.1f} sec\n")
+
+
+def prewarm(fast_tables: bool = False):
+    """
+    Loads models ahead of the first request.
+    Intended for applications embedding the converter (FastAPI/Flask),
+    call it once at startup.
+    """
+    warmup_converter(_init_once(fast_tables))
+
+
+def convert_in_chunks(converter, pdf_abs: str, output_path: Path, chunk_pages: int) -> tuple:
+    """
+    Converts PDF by page ranges and appends Markdown of each range to the
+    output file. Only one range is kept in memory, and output appears
+    as soon as the first range is done.
+    Ranges are written to a temporary file, which replaces the output file
+    only after the whole document is converted.
+    
+    Returns:
+        Tuple (character count, conversion time, export time)
+    """
+    import pypdfium2
+    
+    pdf = pypdfium2.PdfDocument(pdf_abs)
+    try:
+        page_count = len(pdf)
+    finally:
+        pdf.close()
+    
+    if page_count == 0:
+        raise ValueError(f"PDF file has no pages: {pdf_abs}")
+    
+    partial_path = output_path.with_name(output_path.name + ".part")
+    conversion_time = 0.0
+    export_time = 0.0
+    char_count = 0
+    write_future = None
+    
+    try:
+        for first_page in range(1, page_count + 1, chunk_pages):
+            last_page = min(first_page + chunk_pages - 1, page_count)
+            
+            step_start = time.time()
+            result = converter.convert(pdf_abs, page_range=(first_page, last_page))
+            conversion_time += time.time() - step_start
+            print(f"[{time.strftime('%H:%M:%S')}] Pages {first_page}-{last_page} of {page_count} converted")
+            
+            step_start = time.time()
+            markdown_content = result.document.export_to_markdown()
+            export_time += time.time() - step_start
+            del result  # Release this range before converting the next one
+            if first_page > 1:
+                markdown_content = "\n\n" + markdown_content
+            
+            # Previous range must be written before appending the next one
+            if write_future is not None:
+                write_future.result()
+            write_future = write_markdown_async(partial_path, markdown_content, append=first_page > 1)
+            char_count += len(markdown_content)
+            del markdown_content
+        
+        write_future.result()
+        partial_path.replace(output_path)
+    except BaseException:
+        # Keep previous output intact, drop the incomplete file
+        if write_future is not None and not write_future.done():
+            write_future.exception()  # Wait for the pending write to finish
+        partial_path.unlink(missing_ok=True)
+        raise
+    
+    return char_count, conversion_time, export_time
+
+
+def print_stats(output_abs, size_kb: float, char_count: int,
+                conversion_time: float, export_time: float, total_time: float):
+    """Prints conversion statistics with a single write to stdout."""
+    line = '=' * 60
+    sys.stdout.write(
+        f"\n{line}\n"
+        f"✓ COMPLETED SUCCESSFULLY!\n"
+        f"{line}\n"
+        f"Result saved to: {output_abs}\n"
+        f"\nStatistics:\n"
+        f"  - Output file size: {size_kb:.2f} KB\n"
+        f"  - Character count: {char_count}\n"
+        f"  - Conversion time: {conversion_time:.1f} sec\n"
+        f"  - Export time: {export_time:.1f} sec\n"
+        f"  - Total time: {total_time:.1f} sec\n"
+        f"{line}\n\n"
+    )
+    sys.stdout.flush()
+
+
+def convert_pdf_to_markdown(pdf_path: str, output_path: str = None, fast_tables: bool = False,
+                            stats: bool = True, chunk_pages: int = 0) -> str:
     """
     Converts PDF file to Markdown format with full recognition.
     Always enabled: OCR for text and table structure recognition.
@@ -129,17 +483,15 @@ def convert_pdf_to_markdown(pdf_path: str, output_path: str = None) -> str:
     Args:
         pdf_path: Path to input PDF file
         output_path: Path to output MD file (optional)
+        fast_tables: Use fast TableFormer mode instead of accurate one
+        stats: Print conversion statistics
+        chunk_pages: Convert by ranges of this many pages (0 - whole document)
     
     Returns:
         Path to created MD file
     """
     # Check input file existence
-    pdf_file = Path(pdf_path)
-    if not pdf_file.exists():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    
-    if not pdf_file.suffix.lower() == '.pdf':
-        raise ValueError(f"File must have .pdf extension: {pdf_path}")
+    pdf_file = validate_pdf(pdf_path)
     
     # Determine output file
     if output_path is None:
@@ -147,34 +499,15 @@ def convert_pdf_to_markdown(pdf_path: str, output_path: str = None) -> str:
     else:
         output_path = Path(output_path)
     
+    pdf_abs = str(pdf_file.absolute())
+    out_abs = str(output_path.absolute())
+    
     print(f"\n{'='*60}")
-    print(f"Input file: {pdf_file.absolute()}")
-    print(f"Output file: {output_path.absolute()}")
+    print(f"Input file: {pdf_abs}")
+    print(f"Output file: {out_abs}")
     print(f"{'='*60}\n")
     
-    # Device setup for displaying information to the user
-    # Note: Docling automatically uses available device through PyTorch
-    device = setup_device()
-    
-    # Register Ctrl+C handler
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Pre-download all models
-    download_models()
-    
-    # Configure PDF processing options
-    # Enable OCR for scanned documents support
-    pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = True  # Enable OCR for Russian text
-    pipeline_options.do_table_structure = True  # Table structure recognition
-    
-    # Create converter with settings
-    # Converter automatically uses best available device (MPS/CUDA/CPU)
-    converter = DocumentConverter(
-        format_options={
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }
-    )
+    converter = _init_once(fast_tables)
     
     print("⏳ Starting PDF processing...")
     print("   This may take some time depending on document size...\n")
@@ -186,48 +519,132 @@ def convert_pdf_to_markdown(pdf_path: str, output_path: str = None) -> str:
         # Add callback for progress tracking
         print(f"[{time.strftime('%H:%M:%S')}] Starting conversion...")
         
-        result = converter.convert(str(pdf_file.absolute()))
-        
-        conversion_time = time.time() - conversion_start
-        print(f"[{time.strftime('%H:%M:%S')}] Conversion completed")
-        
-        print(f"\n✓ PDF processed in {conversion_time:.1f} seconds")
-        
-        # Export to Markdown
-        print("⏳ Exporting to Markdown...")
-        export_start = time.time()
-        markdown_content = result.document.export_to_markdown()
-        export_time = time.time() - export_start
-        
-        # Save to file
-        output_path.write_text(markdown_content, encoding='utf-8')
+        if chunk_pages:
+            char_count, conversion_time, export_time = convert_in_chunks(
+                converter, pdf_abs, output_path, chunk_pages
+            )
+            print(f"\n✓ PDF processed in {conversion_time:.1f} seconds")
+        else:
+            result = converter.convert(pdf_abs)
+            
+            conversion_time = time.time() - conversion_start
+            print(f"[{time.strftime('%H:%M:%S')}] Conversion completed")
+            
+            print(f"\n✓ PDF processed in {conversion_time:.1f} seconds")
+            
+            # Export to Markdown
+            print("⏳ Exporting to Markdown...")
+            export_start = time.time()
+            markdown_content = result.document.export_to_markdown()
+            export_time = time.time() - export_start
+            
+            # Save to file in background while timings are collected
+            write_future = write_markdown_async(output_path, markdown_content)
+            print(f"✓ Exported in {export_time:.1f} seconds")
+            
+            write_future.result()
+            char_count = len(markdown_content)
         
         total_time = time.time() - conversion_start
         
-        print(f"\n{'='*60}")
-        print(f"✓ COMPLETED SUCCESSFULLY!")
-        print(f"{'='*60}")
-        print(f"Result saved to: {output_path.absolute()}")
-        print(f"\nStatistics:")
-        print(f"  - Output file size: {output_path.stat().st_size / 1024:.2f} KB")
-        print(f"  - Character count: {len(markdown_content)}")
-        print(f"  - Conversion time: {conversion_time:.1f} sec")
-        print(f"  - Export time: {export_time:.1f} sec")
-        print(f"  - Total time: {total_time:.1f} sec")
-        print(f"{'='*60}\n")
+        if stats:
+            size_kb = output_path.stat().st_size / 1024
+            print_stats(out_abs, size_kb, char_count,
+                        conversion_time, export_time, total_time)
         
-        return str(output_path.absolute())
+        return out_abs
         
     except KeyboardInterrupt:
         print(f"\n\n⚠ Processing interrupted by user (Ctrl+C)")
         raise
     except Exception as e:
-        print(f"\n✗ Conversion error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        logger.exception("Conversion error: %s", e)
         raise
 
 
+def convert_batch(pdf_paths: list, fast_tables: bool = False) -> list:
+    """
+    Converts several PDF files with a single converter.
+    Markdown files are saved next to the input files.
+    
+    Args:
+        pdf_paths: Paths to input PDF files
+        fast_tables: Use fast TableFormer mode instead of accurate one
+    
+    Returns:
+        Paths to created MD files
+    """
+    if not pdf_paths:
+        raise ValueError("No PDF files to convert")
+    
+    pdf_files = [validate_pdf(pdf_path) for pdf_path in pdf_paths]
+    
+    from docling.datamodel.base_models import ConversionStatus
+    
+    converter = _init_once(fast_tables)
+    
+    print(f"⏳ Processing {len(pdf_files)} PDF files...\n")
+    
+    batch_start = time.time()
+    created = []
+    writes = []
+    results = converter.convert_all(
+        [str(pdf_file.absolute()) for pdf_file in pdf_files],
+        raises_on_error=False,
+    )
+    for result in results:
+        pdf_file = Path(result.input.file)
+        if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+            print(f"   ✗ {pdf_file.name}: {result.status.value}", file=sys.stderr)
+            continue
+        
+        # Next document is converted while this one is being written
+        output_path = pdf_file.with_suffix('.md')
+        writes.append(write_markdown_async(output_path, result.document.export_to_markdown()))
+        created.append(str(output_path))
+        print(f"   ✓ {pdf_file.name} -> {output_path.name}")
+    
+    for write_future in writes:
+        write_future.result()
+    
+    print(f"\n✓ Converted {len(created)} of {len(pdf_files)} files "
+          f"in {time.time() - batch_start:.1f} sec\n")
+    
+    if len(created) < len(pdf_files):
+        raise RuntimeError(f"Failed to convert {len(pdf_files) - len(created)} file(s)")
+    
+    return created
+
+
+def serve(fast_tables: bool = False, chunk_pages: int = 0):
+    """
+    Server mode: reads PDF paths from stdin (one per line) and converts them.
+    Models are loaded once and reused for every document.
+    """
+    prewarm(fast_tables)
+    
+    print("✓ Server mode: enter PDF file paths, one per line (Ctrl+D to exit)\n")
+    
+    for line in sys.stdin:
+        pdf_path = line.strip()
+        if not pdf_path:
+            continue
+        try:
+            convert_pdf_to_markdown(pdf_path, fast_tables=fast_tables,
+                                    stats=logger.isEnabledFor(logging.INFO),
+                                    chunk_pages=chunk_pages)
+        except Exception as e:
+            print(f"\n✗ Error: {e}", file=sys.stderr)
+    
+    return 0
+
+
+def read_file_list(list_path: str) -> list:
+    """Reads PDF paths from a text file, one per line."""
+    lines = Path(list_path).read_text(encoding='utf-8').splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
 def main():
     """Main function with command-line argument parsing."""
     parser = argparse.ArgumentParser(
@@ -238,6 +655,9 @@ Usage examples:
   %(prog)s document.pdf
   %(prog)s document.pdf -o output.md
   %(prog)s /path/to/document.pdf -o /path/to/output.md
+  %(prog)s first.pdf second.pdf third.pdf
+  %(prog)s --batch files.txt
+  %(prog)s --serve
 
 Supported features:
   - Complex document structures
@@ -251,14 +671,44 @@ Supported features:
     parser.add_argument(
         'input_pdf',
         type=str,
-        help='Path to input PDF file'
+        nargs='*',
+        help='Path to input PDF file (several files are converted in one batch)'
     )
     
     parser.add_argument(
         '-o', '--output',
         type=str,
         default=None,
-        help='Path to output MD file (default: input file name with .md extension)'
+        help='Path to output MD file, single input only (default: input file name with .md extension)'
+    )
+    
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='FILE_LIST',
+        default=None,
+        help='Text file with PDF paths (one per line) to convert with a single converter'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Server mode: read PDF paths from stdin and keep models loaded between files'
+    )
+    
+    parser.add_argument(
+        '--fast-tables',
+        action='store_true',
+        help='Fast table structure recognition (less accurate on complex tables)'
+    )
+    
+    parser.add_argument(
+        '--chunk-pages',
+        type=int,
+        metavar='N',
+        default=0,
+        help='Convert large documents by ranges of N pages, writing output as it goes '
+             '(less memory, single input or --serve only)'
     )
     
     parser.add_argument(
@@ -269,8 +719,37 @@ Supported features:
     
     args = parser.parse_args()
     
+    # Register Ctrl+C handler
+    signal.signal(signal.SIGINT, signal_handler)
+    
+    if args.serve:
+        if args.input_pdf or args.batch or args.output:
+            parser.error('--serve cannot be combined with input files, --batch or --output')
+    elif not args.input_pdf and not args.batch:
+        parser.error('the following arguments are required: input_pdf')
+    elif args.output and (args.batch or len(args.input_pdf) > 1):
+        parser.error('--output can only be used with a single input file')
+    elif args.chunk_pages and (args.batch or len(args.input_pdf) > 1):
+        parser.error('--chunk-pages can only be used with a single input file or --serve')
+    
+    if args.chunk_pages < 0:
+        parser.error('--chunk-pages must be a positive number')
+    
     try:
-        convert_pdf_to_markdown(args.input_pdf, args.output)
+        if args.serve:
+            return serve(args.fast_tables, args.chunk_pages)
+        
+        pdf_paths = list(args.input_pdf)
+        if args.batch:
+            pdf_paths.extend(read_file_list(args.batch))
+        if not pdf_paths:
+            raise ValueError(f"No PDF files listed in {args.batch}")
+        
+        if len(pdf_paths) == 1 and not args.batch:
+            convert_pdf_to_markdown(pdf_paths[0], args.output, args.fast_tables,
+                                    chunk_pages=args.chunk_pages)
+        else:
+            convert_batch(pdf_paths, args.fast_tables)
         return 0
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)